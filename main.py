@@ -1,11 +1,17 @@
 # main.py
 import uvicorn
-import json
+import asyncio
+import os
+import time
+import orjson
 from uuid import uuid4
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 
-from fastapi import FastAPI, HTTPException, status
+from fastapi import FastAPI, Header, HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 from fastapi.middleware.cors import CORSMiddleware
@@ -14,7 +20,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 class ProductBase(BaseModel):
     nombre: str = Field(..., example="Laptop Gamer")
-    precio: float = Field(..., gt=0, example=1200.50)
+    precio: float = Field(..., gt=0, allow_inf_nan=False, example=1200.50)
     descripcion: str = Field(..., example="Potente laptop para gaming con RTX 3080.")
 
 class ProductCreate(ProductBase):
@@ -23,9 +29,6 @@ class ProductCreate(ProductBase):
 class ProductInDB(ProductBase):
     id: str = Field(..., example="a1b2c3d4-e5f6-7890-1234-567890abcdef")
 
-    class Config:
-        from_attributes = True
-
 class OrderItem(BaseModel):
     product_id: str = Field(..., example="a1b2c3d4-e5f6-7890-1234-567890abcdef")
 
@@ -38,9 +41,6 @@ class OrderInDB(BaseModel):
     fecha: datetime = Field(..., example="2024-07-21T18:30:00.000000")
     estado: str = Field(..., example="pendiente")
 
-    class Config:
-        from_attributes = True
-
 # --- Rutas de Archivos JSON ---
 PRODUCTS_FILE = "products.json"
 ORDERS_FILE = "orders.json"
@@ -50,38 +50,177 @@ ORDERS_FILE = "orders.json"
 def _load_data(filename: str) -> List[Dict[str, Any]]:
     """Carga datos desde un archivo JSON."""
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(filename, "rb") as f:
+            return orjson.loads(f.read())
     except FileNotFoundError:
         return []
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         print(f"Advertencia: El archivo '{filename}' está corrupto o vacío. Iniciando con datos vacíos.")
         return []
 
-def _save_data(filename: str, data: List[Dict[str, Any]]):
-    """Guarda datos en un archivo JSON."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
-
-def get_products_data() -> List[Dict[str, Any]]:
-    return _load_data(PRODUCTS_FILE)
-
-def save_products_data(data: List[Dict[str, Any]]):
-    _save_data(PRODUCTS_FILE, data)
+def _dump_data(data: List[Dict[str, Any]]) -> bytes:
+    """Serializa los datos a JSON compacto en UTF-8."""
+    return orjson.dumps(data)
 
-def get_orders_data() -> List[Dict[str, Any]]:
-    return _load_data(ORDERS_FILE)
-
-def save_orders_data(data: List[Dict[str, Any]]):
-    _save_data(ORDERS_FILE, data)
+def _write_data(filename: str, content: bytes):
+    """
+    Escribe contenido ya serializado en un archivo de forma atómica.
+    Se escribe primero un archivo temporal y luego se reemplaza el original, así
+    una interrupción a mitad de escritura nunca deja el archivo truncado.
+    """
+    tmp_filename = filename + ".tmp"
+    with open(tmp_filename, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_filename, filename)
+
+# --- Datos en Memoria ---
+# Se cargan una sola vez al iniciar la aplicación; las lecturas se sirven desde aquí
+# y el archivo solo se reescribe cuando una operación modifica los datos.
+_PRODUCTS: List[Dict[str, Any]] = []
+_ORDERS: List[Dict[str, Any]] = []
+
+# Índices por ID que apuntan a los mismos diccionarios de las listas.
+_PRODUCTS_BY_ID: Dict[str, Dict[str, Any]] = {}
+_ORDERS_BY_ID: Dict[str, Dict[str, Any]] = {}
+
+# JSON serializado de cada lista. Es el mismo contenido que se envía en los listados
+# y que se guarda en disco, por lo que se serializa una sola vez tras cada cambio.
+_products_bytes: Optional[bytes] = None
+_orders_bytes: Optional[bytes] = None
+
+def products_payload() -> bytes:
+    global _products_bytes
+    if _products_bytes is None:
+        _products_bytes = _dump_data(_PRODUCTS)
+    return _products_bytes
+
+def orders_payload() -> bytes:
+    global _orders_bytes
+    if _orders_bytes is None:
+        _orders_bytes = _dump_data(_ORDERS)
+    return _orders_bytes
+
+# Versiones de los listados para el ETag. Se incrementan con cada modificación y se
+# combinan con un identificador del proceso para que no se repitan tras un reinicio.
+_BOOT_ID = uuid4().hex[:8]
+_products_version = 0
+_orders_version = 0
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Indica si el encabezado If-None-Match del cliente coincide con el ETag actual."""
+    if if_none_match is None:
+        return False
+    if if_none_match == etag:
+        return True
+    return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(","))
+
+# --- Guardado Diferido en Disco ---
+# Las operaciones de escritura solo marcan los datos como modificados; una tarea en
+# segundo plano los guarda cada FLUSH_INTERVAL segundos, de modo que una ráfaga de
+# cambios se traduce en una sola escritura fuera del ciclo de la petición.
+FLUSH_INTERVAL = 0.5  # segundos
+
+_products_dirty = False
+_orders_dirty = False
+
+_flush_stop = asyncio.Event()
+_flush_task: Optional[asyncio.Task] = None
+
+def mark_products_dirty():
+    global _products_dirty, _products_bytes, _products_version
+    _products_dirty = True
+    _products_bytes = None
+    _products_version += 1
+
+def mark_orders_dirty():
+    global _orders_dirty, _orders_bytes, _orders_version
+    _orders_dirty = True
+    _orders_bytes = None
+    _orders_version += 1
+
+def _serialize_payload(filename: str, payload: Callable[[], bytes]) -> Optional[bytes]:
+    """Obtiene el contenido a guardar. Devuelve None si los datos no se pueden serializar."""
+    try:
+        return payload()
+    except orjson.JSONEncodeError as e:
+        print(f"Advertencia: No se pudo serializar '{filename}': {e}. Se reintentará.")
+        return None
+
+async def _flush_file(filename: str, content: bytes) -> bool:
+    """Guarda el contenido en disco desde un hilo. Devuelve False si la escritura falla."""
+    # El contenido ya está serializado en el hilo del event loop, así que es una copia
+    # consistente aunque otra petición modifique la lista mientras se escribe el archivo.
+    try:
+        await asyncio.to_thread(_write_data, filename, content)
+    except OSError as e:
+        print(f"Advertencia: No se pudo guardar '{filename}': {e}. Se reintentará.")
+        return False
+    return True
+
+async def flush_dirty_data():
+    """Guarda en disco los archivos con cambios pendientes."""
+    global _products_dirty, _orders_dirty
+    # La marca se limpia solo después de serializar; si falla, el archivo sigue pendiente.
+    if _products_dirty:
+        content = _serialize_payload(PRODUCTS_FILE, products_payload)
+        if content is not None:
+            _products_dirty = False
+            if not await _flush_file(PRODUCTS_FILE, content):
+                _products_dirty = True
+    if _orders_dirty:
+        content = _serialize_payload(ORDERS_FILE, orders_payload)
+        if content is not None:
+            _orders_dirty = False
+            if not await _flush_file(ORDERS_FILE, content):
+                _orders_dirty = True
+
+async def _flush_periodically():
+    """Ejecuta flush_dirty_data cada FLUSH_INTERVAL segundos hasta que se detenga la app."""
+    while True:
+        try:
+            await asyncio.wait_for(_flush_stop.wait(), timeout=FLUSH_INTERVAL)
+            return
+        except asyncio.TimeoutError:
+            pass
+        # Un error inesperado no debe detener el guardado del resto de la sesión.
+        try:
+            await flush_dirty_data()
+        except Exception as e:
+            print(f"Advertencia: Error inesperado al guardar los datos: {e}. Se reintentará.")
+
+def _save_pending(filename: str, payload: Callable[[], bytes]) -> bool:
+    """Guarda de forma síncrona los cambios pendientes de un archivo al detener la app."""
+    content = _serialize_payload(filename, payload)
+    if content is None:
+        return False
+    try:
+        _write_data(filename, content)
+    except OSError as e:
+        print(f"Advertencia: No se pudo guardar '{filename}': {e}")
+        return False
+    return True
 
 # --- Inicialización de FastAPI ---
 app = FastAPI(
     title="Fake E-commerce API",
     description="API fake para simulación de gestión de productos y pedidos con datos en JSON.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request, exc: RequestValidationError):
+    """
+    Igual que el manejador por defecto, pero con orjson: la respuesta de error puede
+    incluir el valor rechazado (p. ej. un precio infinito), que el módulo json no acepta.
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())},
+    )
+
 # --- Configuración CORS ---
 origins = [
     "http://localhost",
@@ -98,44 +237,91 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,       # Lista de orígenes permitidos
     allow_credentials=True,      # Permite cookies y encabezados de autenticación
-    allow_methods=["*"],         # Permite todos los métodos (GET, POST, PUT, DELETE, etc.)
-    allow_headers=["*"],         # Permite todos los encabezados
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Métodos usados por la API
+    allow_headers=["Content-Type", "Authorization", "If-None-Match"],  # Encabezados aceptados
+    expose_headers=["ETag"],     # Permite al cliente leer el ETag de los listados
 )
 
+# --- Ciclo de Vida de la Aplicación ---
+
+@app.on_event("startup")
+async def load_data():
+    """Carga los archivos JSON en memoria e inicia el guardado periódico."""
+    global _flush_task, _products_bytes, _orders_bytes
+    _PRODUCTS[:] = _load_data(PRODUCTS_FILE)
+    _ORDERS[:] = _load_data(ORDERS_FILE)
+    _products_bytes = None
+    _orders_bytes = None
+    _PRODUCTS_BY_ID.clear()
+    _PRODUCTS_BY_ID.update((p["id"], p) for p in _PRODUCTS)
+    _ORDERS_BY_ID.clear()
+    _ORDERS_BY_ID.update((o["id"], o) for o in _ORDERS)
+
+    _flush_stop.clear()
+    _flush_task = asyncio.create_task(_flush_periodically())
+
+@app.on_event("shutdown")
+async def save_pending_data():
+    """Detiene el guardado periódico y guarda los cambios pendientes antes de salir."""
+    global _products_dirty, _orders_dirty
+    _flush_stop.set()
+    if _flush_task is not None:
+        try:
+            await _flush_task
+        except Exception as e:
+            print(f"Advertencia: El guardado periódico terminó con un error: {e}")
+    if _products_dirty and _save_pending(PRODUCTS_FILE, products_payload):
+        _products_dirty = False
+    if _orders_dirty and _save_pending(ORDERS_FILE, orders_payload):
+        _orders_dirty = False
+
 # --- Endpoints para Productos ---
 
-@app.get("/products/", response_model=List[ProductInDB], summary="Obtener todos los productos")
-async def get_all_products():
+@app.get(
+    "/products/",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[ProductInDB]}},
+    summary="Obtener todos los productos",
+)
+async def get_all_products(if_none_match: Optional[str] = Header(None)):
     """
     Recupera una lista de todos los productos disponibles.
+    Si el cliente envía el ETag de la última respuesta y no hubo cambios, responde 304.
     """
-    products = get_products_data()
-    return products
+    etag = f'"{_BOOT_ID}-{_products_version}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    # Los datos ya se validaron al crearse, así que se devuelve el JSON en caché
+    # sin volver a pasar cada elemento por Pydantic.
+    return Response(content=products_payload(), media_type="application/json", headers={"ETag": etag})
 
 @app.get("/products/{product_id}", response_model=ProductInDB, summary="Obtener producto por ID")
 async def get_product_by_id(product_id: str):
     """
     Recupera un producto específico utilizando su ID.
     """
-    products = get_products_data()
-    for product in products:
-        if product["id"] == product_id:
-            return product
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Producto con ID '{product_id}' no encontrado"
-    )
+    product = _PRODUCTS_BY_ID.get(product_id)
+    if product is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Producto con ID '{product_id}' no encontrado"
+        )
+    return product
 
 @app.post("/products/", response_model=ProductInDB, status_code=status.HTTP_201_CREATED, summary="Crear un nuevo producto")
 async def create_product(product: ProductCreate):
     """
     Crea un nuevo producto con un ID único.
     """
-    products = get_products_data()
-    new_product = product.model_dump()
-    new_product["id"] = str(uuid4())
-    products.append(new_product)
-    save_products_data(products)
+    new_product = {
+        "nombre": product.nombre,
+        "precio": product.precio,
+        "descripcion": product.descripcion,
+        "id": uuid4().hex,
+    }
+    _PRODUCTS.append(new_product)
+    _PRODUCTS_BY_ID[new_product["id"]] = new_product
+    mark_products_dirty()
     return new_product
 
 @app.put("/products/{product_id}", response_model=ProductInDB, summary="Actualizar un producto existente")
@@ -143,58 +329,91 @@ async def update_product(product_id: str, product_update: ProductCreate):
     """
     Actualiza los detalles de un producto existente.
     """
-    products = get_products_data()
-    for i, product in enumerate(products):
-        if product["id"] == product_id:
-            updated_product = product_update.model_dump()
-            updated_product["id"] = product_id  # Aseguramos que el ID no cambie
-            products[i] = updated_product
-            save_products_data(products)
-            return updated_product
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Producto con ID '{product_id}' no encontrado"
-    )
+    product = _PRODUCTS_BY_ID.get(product_id)
+    if product is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Producto con ID '{product_id}' no encontrado"
+        )
+    # Se actualiza el mismo diccionario para que la lista y el índice sigan sincronizados;
+    # el ID no cambia porque no forma parte de ProductCreate.
+    product["nombre"] = product_update.nombre
+    product["precio"] = product_update.precio
+    product["descripcion"] = product_update.descripcion
+    mark_products_dirty()
+    return product
 
 @app.delete("/products/{product_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Eliminar un producto")
 async def delete_product(product_id: str):
     """
     Elimina un producto de la lista.
     """
-    products = get_products_data()
-    initial_len = len(products)
-    products = [p for p in products if p["id"] != product_id]
-    if len(products) == initial_len:
+    product = _PRODUCTS_BY_ID.pop(product_id, None)
+    if product is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Producto con ID '{product_id}' no encontrado"
         )
-    save_products_data(products)
+    # Se busca por identidad para no comparar cada diccionario por valor.
+    del _PRODUCTS[next(i for i, p in enumerate(_PRODUCTS) if p is product)]
+    mark_products_dirty()
     return {"message": "Producto eliminado exitosamente"}
 
 # --- Endpoints para Pedidos (Orders) ---
 
-@app.get("/orders/", response_model=List[OrderInDB], summary="Obtener todos los pedidos")
-async def get_all_orders():
+# Última fecha generada para los pedidos; se reutiliza dentro del mismo segundo.
+_last_ts_second = -1
+_last_ts_str = ""
+
+def _order_timestamp() -> str:
+    """Devuelve la fecha actual en ISO 8601 truncada al segundo."""
+    global _last_ts_second, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_second:
+        _last_ts_second = now
+        # Se usa la misma lectura del reloj que define el segundo, sin microsegundos.
+        _last_ts_str = datetime.fromtimestamp(now).isoformat()
+    return _last_ts_str
+
+def _check_products_exist(product_ids: List[str], action: str):
+    """Lanza un error 400 con todos los IDs de productos que no existen."""
+    missing = set(product_ids).difference(_PRODUCTS_BY_ID)
+    if missing:
+        # Se informan en el orden de la petición; los IDs pueden ser de tipos distintos.
+        ids = ", ".join(f"'{p_id}'" for p_id in dict.fromkeys(product_ids) if p_id in missing)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Productos con ID {ids} no encontrados. No se puede {action} el pedido."
+        )
+
+@app.get(
+    "/orders/",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": List[OrderInDB]}},
+    summary="Obtener todos los pedidos",
+)
+async def get_all_orders(if_none_match: Optional[str] = Header(None)):
     """
     Recupera una lista de todos los pedidos realizados.
+    Si el cliente envía el ETag de la última respuesta y no hubo cambios, responde 304.
     """
-    orders = get_orders_data()
-    return orders
+    etag = f'"{_BOOT_ID}-{_orders_version}"'
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=orders_payload(), media_type="application/json", headers={"ETag": etag})
 
 @app.get("/orders/{order_id}", response_model=OrderInDB, summary="Obtener pedido por ID")
 async def get_order_by_id(order_id: str):
     """
     Recupera un pedido específico utilizando su ID.
     """
-    orders = get_orders_data()
-    for order in orders:
-        if order["id"] == order_id:
-            return order
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Pedido con ID '{order_id}' no encontrado"
-    )
+    order = _ORDERS_BY_ID.get(order_id)
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pedido con ID '{order_id}' no encontrado"
+        )
+    return order
 
 @app.post("/orders/", response_model=OrderInDB, status_code=status.HTTP_201_CREATED, summary="Crear un nuevo pedido")
 async def create_order(order: OrderCreate):
@@ -202,27 +421,19 @@ async def create_order(order: OrderCreate):
     Crea un nuevo pedido con una lista de IDs de productos.
     Verifica que los productos existan.
     """
-    products_in_db = get_products_data()
-    existing_product_ids = {p["id"] for p in products_in_db}
-    
     # Validar que todos los product_id en el pedido existan
     requested_product_ids = [item.product_id for item in order.products]
-    for p_id in requested_product_ids:
-        if p_id not in existing_product_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Producto con ID '{p_id}' no encontrado. No se puede crear el pedido."
-            )
-
-    orders = get_orders_data()
+    _check_products_exist(requested_product_ids, "crear")
+
     new_order_data = {
-        "id": str(uuid4()),
+        "id": uuid4().hex,
         "products": requested_product_ids,
-        "fecha": datetime.now().isoformat(),
+        "fecha": _order_timestamp(),
         "estado": "pendiente"  # Estado inicial por defecto
     }
-    orders.append(new_order_data)
-    save_orders_data(orders)
+    _ORDERS.append(new_order_data)
+    _ORDERS_BY_ID[new_order_data["id"]] = new_order_data
+    mark_orders_dirty()
     return new_order_data
 
 @app.put("/orders/{order_id}", response_model=OrderInDB, summary="Actualizar un pedido existente")
@@ -232,34 +443,36 @@ async def update_order(order_id: str, updated_order_data: Dict[str, Any]):
     Permite actualizar 'estado' y la lista de 'products'.
     La fecha no es actualizable.
     """
-    orders = get_orders_data()
-    products_in_db = get_products_data()
-    existing_product_ids = {p["id"] for p in products_in_db}
-
-    for i, order in enumerate(orders):
-        if order["id"] == order_id:
-            # Validar y actualizar productos si se proporcionan
-            if "products" in updated_order_data:
-                requested_product_ids = updated_order_data["products"]
-                for p_id in requested_product_ids:
-                    if p_id not in existing_product_ids:
-                        raise HTTPException(
-                            status_code=status.HTTP_400_BAD_REQUEST,
-                            detail=f"Producto con ID '{p_id}' no encontrado. No se puede actualizar el pedido."
-                        )
-                order["products"] = requested_product_ids
-            
-            # Actualizar estado si se proporciona
-            if "estado" in updated_order_data:
-                order["estado"] = updated_order_data["estado"]
-            
-            orders[i] = order
-            save_orders_data(orders)
-            return order
-    raise HTTPException(
-        status_code=status.HTTP_404_NOT_FOUND,
-        detail=f"Pedido con ID '{order_id}' no encontrado"
-    )
+    order = _ORDERS_BY_ID.get(order_id)
+    if order is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pedido con ID '{order_id}' no encontrado"
+        )
+
+    # orjson no admite enteros de más de 64 bits; se rechazan antes de guardarlos en
+    # memoria para que no impidan serializar la lista de pedidos.
+    try:
+        orjson.dumps({k: v for k, v in updated_order_data.items() if k in ("products", "estado")})
+    except orjson.JSONEncodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"El pedido contiene valores que no se pueden guardar: {e}"
+        )
+
+    # Validar y actualizar productos si se proporcionan
+    if "products" in updated_order_data:
+        requested_product_ids = updated_order_data["products"]
+        _check_products_exist(requested_product_ids, "actualizar")
+        order["products"] = requested_product_ids
+        mark_orders_dirty()
+
+    # Actualizar estado si se proporciona
+    if "estado" in updated_order_data:
+        order["estado"] = updated_order_data["estado"]
+        mark_orders_dirty()
+
+    return order
 
 
 @app.delete("/orders/{order_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Eliminar un pedido")
@@ -267,24 +480,18 @@ async def delete_order(order_id: str):
     """
     Elimina un pedido de la lista.
     """
-    orders = get_orders_data()
-    initial_len = len(orders)
-    orders = [o for o in orders if o["id"] != order_id]
-    if len(orders) == initial_len:
+    order = _ORDERS_BY_ID.pop(order_id, None)
+    if order is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pedido con ID '{order_id}' no encontrado"
         )
-    save_orders_data(orders)
+    del _ORDERS[next(i for i, o in enumerate(_ORDERS) if o is order)]
+    mark_orders_dirty()
     return {"message": "Pedido eliminado exitosamente"}
 
 
 if __name__ == "__main__":
-    # Asegúrate de que los archivos JSON existan con contenido inicial si están vacíos
-    # Esto es útil para la primera ejecución
-    _ = get_products_data() # Carga para crear el archivo si no existe
-    _ = get_orders_data()   # Carga para crear el archivo si no existe
-
     print("\nAPI Fake lista para usarse.")
     print("Accede a la documentación interactiva en: http://127.0.0.1:8000/docs")
     print("Para detener el servidor, presiona CTRL+C en la terminal.")